@@ -3,17 +3,25 @@
 Generate calendar.ics from events.json for calendar subscription.
 """
 
-import json
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+from scrapers.jsonio import loads
+
+
+# Large write buffer so the calendar goes out in a handful of syscalls
+OUTPUT_BUFFER_SIZE = 1 << 18  # 256 KiB
+
+_ICS_ESCAPE = str.maketrans({"\\": "\\\\", ";": "\\;", ",": "\\,", "\n": "\\n"})
+
 
 def escape_ics(text):
     """Escape special characters for ICS format."""
-    if not text:
-        return ""
-    return text.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+    return text.translate(_ICS_ESCAPE) if text else ""
 
 
 def format_ics_date(date_str, time_str=None):
@@ -26,8 +34,8 @@ def format_ics_date(date_str, time_str=None):
     return f"{date_part}T{time_part}"
 
 
-def generate_vevent(event):
-    """Generate a VEVENT block for an event."""
+def generate_vevent(event, dtstamp):
+    """Yield the lines of a VEVENT block for an event."""
     uid = f"{event['date']}-{event.get('startTime', '0000').replace(':', '')}-{event['source']}@rvafiguredrawing"
 
     dtstart = format_ics_date(event["date"], event.get("startTime"))
@@ -44,22 +52,19 @@ def generate_vevent(event):
     ]
     description = "\\n\\n".join(part for part in description_parts if part)
 
-    lines = [
-        "BEGIN:VEVENT",
-        f"UID:{uid}",
-        f"DTSTAMP:{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S')}Z",
-        f"DTSTART:{dtstart}",
-        f"DTEND:{dtend}",
-        f"SUMMARY:{escape_ics(event.get('title', 'Figure Drawing'))}",
-        f"LOCATION:{escape_ics(location)}",
-        f"DESCRIPTION:{escape_ics(description)}",
-    ]
+    yield "BEGIN:VEVENT"
+    yield f"UID:{uid}"
+    yield f"DTSTAMP:{dtstamp}"
+    yield f"DTSTART:{dtstart}"
+    yield f"DTEND:{dtend}"
+    yield f"SUMMARY:{escape_ics(event.get('title', 'Figure Drawing'))}"
+    yield f"LOCATION:{escape_ics(location)}"
+    yield f"DESCRIPTION:{escape_ics(description)}"
 
     if event.get("url"):
-        lines.append(f"URL:{event['url']}")
+        yield f"URL:{event['url']}"
 
-    lines.append("END:VEVENT")
-    return "\r\n".join(lines)
+    yield "END:VEVENT"
 
 
 def get_future_events(events_data):
@@ -68,25 +73,28 @@ def get_future_events(events_data):
     return [e for e in events_data.get("events", []) if e.get("date", "") >= today]
 
 
-def generate_ics(events_data):
-    """Generate full ICS calendar content."""
-    header = [
-        "BEGIN:VCALENDAR",
-        "VERSION:2.0",
-        "PRODID:-//RVA Figure Drawing//Calendar//EN",
-        "CALSCALE:GREGORIAN",
-        "METHOD:PUBLISH",
-        "X-WR-CALNAME:RVA Figure Drawing",
-        "X-WR-CALDESC:Figure drawing sessions in Richmond, VA",
-        "REFRESH-INTERVAL;VALUE=DURATION:P1D",
-    ]
+ICS_HEADER = (
+    "BEGIN:VCALENDAR",
+    "VERSION:2.0",
+    "PRODID:-//RVA Figure Drawing//Calendar//EN",
+    "CALSCALE:GREGORIAN",
+    "METHOD:PUBLISH",
+    "X-WR-CALNAME:RVA Figure Drawing",
+    "X-WR-CALDESC:Figure drawing sessions in Richmond, VA",
+    "REFRESH-INTERVAL;VALUE=DURATION:P1D",
+)
 
-    footer = ["END:VCALENDAR"]
 
-    future_events = get_future_events(events_data)
-    vevents = [generate_vevent(event) for event in future_events]
+def generate_ics(events):
+    """Yield the lines of the full ICS calendar for already-filtered events."""
+    yield from ICS_HEADER
 
-    return "\r\n".join(header + vevents + footer)
+    # One timestamp for the whole calendar
+    dtstamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    for event in events:
+        yield from generate_vevent(event, dtstamp)
+
+    yield "END:VCALENDAR"
 
 
 def main():
@@ -101,16 +109,14 @@ def main():
         print(f"Error: {events_path} not found")
         sys.exit(1)
 
-    with open(events_path, "r", encoding="utf-8") as f:
-        events_data = json.load(f)
+    events_data = loads(events_path.read_bytes())
 
-    ics_content = generate_ics(events_data)
+    future_events = get_future_events(events_data)
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(ics_content)
+    with open(output_path, "wb", buffering=OUTPUT_BUFFER_SIZE) as f:
+        f.writelines((line + "\r\n").encode("utf-8") for line in generate_ics(future_events))
 
-    event_count = len(get_future_events(events_data))
-    print(f"Generated {output_path} with {event_count} events")
+    print(f"Generated {output_path} with {len(future_events)} events")
 
 
 if __name__ == "__main__":
@@ -12,7 +12,6 @@ Usage:
 """
 
 import argparse
-import json
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
@@ -21,6 +20,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from scrapers import run_all_scrapers, get_cache
+from scrapers.jsonio import dumps
 
 
 def main():
@@ -45,6 +45,7 @@ def main():
 
     if args.clear_cache:
         cache.invalidate_all()
+        cache.flush()
         print("Cache cleared")
         return
 
@@ -58,19 +59,19 @@ def main():
 
     # Build output
     output = {
-        "lastUpdated": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "lastUpdated": datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z"),
         "events": events,
     }
 
     # Output
     if args.output:
         output_path = Path(args.output)
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(output, f, indent=2)
+        with open(output_path, "wb") as f:
+            f.write(dumps(output))
         print(f"\nWrote {len(events)} events to {output_path}")
     else:
         # Print to stdout for piping
-        print(json.dumps(output, indent=2))
+        print(dumps(output).decode("utf-8"))
 
 
 if __name__ == "__main__":
@@ -13,6 +13,9 @@ Usage:
     events = run_all_scrapers()
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import chain
+
 from .cache import get_cache, ScraperCache, SOURCE_TTLS
 from .base import Event, BaseScraper
 
@@ -42,7 +45,7 @@ def run_all_scrapers(
     """
     from datetime import datetime
 
-    from .claude_scraper import load_sources, create_scraper
+    from .claude_scraper import ClaudeBatchScraper, ClaudePlaywrightScraper, load_sources, create_scraper
 
     # Load source configs from sources.json
     all_source_configs = load_sources()
@@ -62,7 +65,6 @@ def run_all_scrapers(
             cache.invalidate(source_id)
         print(f"Cache cleared for: {list(scrapers_to_run.keys())}")
 
-    all_events = []
     print(f"Running {len(scrapers_to_run)} scrapers: {list(scrapers_to_run.keys())}")
 
     # Check which sources actually need scraping (not cached)
@@ -84,30 +86,57 @@ def run_all_scrapers(
     else:
         print(f"Scraping {len(scrapers_needed)} sources: {[s[0] for s in scrapers_needed]}")
 
-        # Run scrapers that need fresh data
-        # Note: Running sequentially because Claude CLI doesn't handle parallel well
-        for source_id, config in scrapers_needed:
+        # One result slot per source, so output order doesn't depend on
+        # which scraper finishes first
+        results: list[list[dict]] = [[] for _ in scrapers_needed]
+
+        # Run scrapers that need fresh data. Claude CLI doesn't handle
+        # parallel well, so Claude-backed scrapers share a single batched
+        # Claude run while plain HTTP scrapers (I/O-bound) run concurrently
+        # in a thread pool.
+        claude_scrapers = []
+        http_scrapers = []
+        for i, (source_id, config) in enumerate(scrapers_needed):
             scraper = create_scraper(config)
-            try:
-                events = scraper.run()
-                all_events.extend(events)
-            except Exception as e:
-                print(f"  [{source_id}] Failed: {e}")
-
-        # Add cached events
-        all_events.extend(cached_events)
-
-    # Sort by date
-    all_events.sort(key=lambda e: (e.get("date", ""), e.get("startTime", "")))
-
-    # Deduplicate (same date + location + time)
-    seen = set()
-    unique_events = []
+            if isinstance(scraper, ClaudePlaywrightScraper):
+                claude_scrapers.append((i, scraper))
+            else:
+                http_scrapers.append((i, scraper))
+
+        with ThreadPoolExecutor(max_workers=max(len(http_scrapers), 1)) as executor:
+            futures = {executor.submit(scraper.run): i for i, scraper in http_scrapers}
+
+            if claude_scrapers:
+                try:
+                    batch = ClaudeBatchScraper([scraper for _, scraper in claude_scrapers])
+                    batch_results = batch.run()
+                except Exception as e:
+                    print(f"  [claude-batch] Failed: {e}")
+                    batch_results = {}
+                for i, scraper in claude_scrapers:
+                    results[i] = batch_results.get(scraper.source_id, [])
+
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    print(f"  [{scrapers_needed[i][0]}] Failed: {e}")
+
+        # Fresh results first, then cached events
+        all_events = list(chain(*results, cached_events))
+
+        # Persist fresh results now rather than waiting for interpreter exit
+        cache.flush()
+
+    # Deduplicate (same date + location + time), keeping the first occurrence
+    unique = {}
     for event in all_events:
-        key = (event.get("date"), event.get("location"), event.get("startTime"))
-        if key not in seen:
-            seen.add(key)
-            unique_events.append(event)
+        unique.setdefault((event.get("date"), event.get("location"), event.get("startTime")), event)
+    unique_events = list(unique.values())
+
+    # Sort by date (Event.to_dict always sets both keys; startTime may be None)
+    unique_events.sort(key=lambda e: (e["date"], e["startTime"] or ""))
 
     print(f"\nTotal: {len(unique_events)} unique events")
     return unique_events
@@ -2,20 +2,38 @@
 Base scraper class with common utilities.
 """
 
+import base64
+import gzip
 import json
 import re
+import threading
+import zlib
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Optional
-from urllib.request import Request, urlopen
-from urllib.error import HTTPError, URLError
-from html.parser import HTMLParser
+from typing import Any, Iterator, Optional
+from http.client import HTTPConnection, HTTPException, HTTPResponse, HTTPSConnection
+from urllib.parse import SplitResult, unquote, urljoin, urlsplit, urlunsplit
+from urllib.request import getproxies, proxy_bypass
 
 from .cache import get_cache
+from .jsonio import loads
 
+MAX_REDIRECTS = 5
+_REDIRECT_CODES = (301, 302, 303, 307, 308)
 
-@dataclass
+_JSON_LD_RE = re.compile(
+    rb'<script\b[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>',
+    re.DOTALL | re.IGNORECASE,
+)
+
+
+def today_str() -> str:
+    """Return today's local date as YYYY-MM-DD."""
+    return datetime.now().strftime("%Y-%m-%d")
+
+
+@dataclass(slots=True)
 class Event:
     """Normalized event structure."""
     source: str
@@ -56,78 +74,88 @@ class Event:
             "instructor": self.instructor,
         }
 
-    def is_future(self) -> bool:
-        """Check if event is in the future."""
-        today = datetime.now().strftime("%Y-%m-%d")
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Event":
+        """Rebuild an Event from a to_dict() result (e.g. a cached event)."""
+        return cls(
+            source=data["source"],
+            source_url=data.get("sourceUrl", ""),
+            title=data.get("title", ""),
+            date=data.get("date", ""),
+            start_time=data.get("startTime"),
+            end_time=data.get("endTime"),
+            location=data.get("location", ""),
+            address=data.get("address", ""),
+            cost=data.get("cost", ""),
+            cost_value=data.get("costValue"),
+            url=data.get("url", ""),
+            description=data.get("description", ""),
+            tags=list(data.get("tags", [])),
+            status=data.get("status", "confirmed"),
+            registration_status=data.get("registrationStatus", "unknown"),
+            instructor=data.get("instructor"),
+        )
+
+    def is_future(self, today: Optional[str] = None) -> bool:
+        """Check if event is in the future.
+
+        Pass today (YYYY-MM-DD) when filtering many events to avoid
+        re-reading the clock for each one.
+        """
+        if today is None:
+            today = today_str()
         return self.date >= today
 
 
-class JsonLdExtractor(HTMLParser):
-    """Extract JSON-LD structured data from HTML."""
+def _parse_json_ld_block(raw: bytes) -> list[dict]:
+    """Parse one JSON-LD script body, flattening top-level lists."""
+    try:
+        data = loads(raw)
+    except json.JSONDecodeError:
+        return []
+    return data if isinstance(data, list) else [data]
 
-    def __init__(self):
-        super().__init__()
-        self.json_ld_blocks: list[dict] = []
-        self._in_json_ld = False
-        self._current_data = ""
-
-    def handle_starttag(self, tag, attrs):
-        if tag == "script":
-            attr_dict = dict(attrs)
-            if attr_dict.get("type") == "application/ld+json":
-                self._in_json_ld = True
-                self._current_data = ""
-
-    def handle_endtag(self, tag):
-        if tag == "script" and self._in_json_ld:
-            self._in_json_ld = False
-            try:
-                data = json.loads(self._current_data)
-                if isinstance(data, list):
-                    self.json_ld_blocks.extend(data)
-                else:
-                    self.json_ld_blocks.append(data)
-            except json.JSONDecodeError:
-                pass
-
-    def handle_data(self, data):
-        if self._in_json_ld:
-            self._current_data += data
-
-
-def extract_json_ld(html: str) -> list[dict]:
-    """Extract all JSON-LD blocks from HTML."""
-    parser = JsonLdExtractor()
-    parser.feed(html)
-    return parser.json_ld_blocks
+
+def iter_json_ld(body: bytes) -> Iterator[dict]:
+    """Lazily yield JSON-LD blocks from raw HTML; each is parsed only when reached."""
+    for match in _JSON_LD_RE.finditer(body):
+        yield from _parse_json_ld_block(match.group(1))
+
+
+def extract_json_ld(body: bytes) -> list[dict]:
+    """Extract all JSON-LD blocks from raw (undecoded) HTML."""
+    return list(iter_json_ld(body))
 
 
 def find_events_in_json_ld(json_ld_blocks: list[dict]) -> list[dict]:
-    """Find Event objects in JSON-LD data."""
+    """Find Event objects in JSON-LD data, in document order."""
     events = []
+    # Walk iteratively; children are pushed reversed so they pop in order.
+    # @graph is just another value here, so it is visited exactly once.
+    stack = list(reversed(json_ld_blocks))
 
-    def search(obj):
+    while stack:
+        obj = stack.pop()
         if isinstance(obj, dict):
             obj_type = obj.get("@type", "")
             if obj_type == "Event" or (isinstance(obj_type, list) and "Event" in obj_type):
                 events.append(obj)
-            # Check @graph
-            if "@graph" in obj:
-                for item in obj["@graph"]:
-                    search(item)
-            # Check nested objects
-            for value in obj.values():
-                search(value)
+            stack.extend(reversed([v for v in obj.values() if isinstance(v, (dict, list))]))
         elif isinstance(obj, list):
-            for item in obj:
-                search(item)
-
-    for block in json_ld_blocks:
-        search(block)
+            stack.extend(reversed(obj))
 
     return events
 
 
+def find_first_json_ld_event(body: bytes) -> Optional[dict]:
+    """Return the first JSON-LD Event in raw HTML, without parsing later blocks."""
+    for block in iter_json_ld(body):
+        events = find_events_in_json_ld([block])
+        if events:
+            return events[0]
+    return None
+
+
 def parse_json_ld_event(event_data: dict, source: str, source_url: str) -> Optional[Event]:
     """Parse a JSON-LD Event into our Event structure."""
     try:
@@ -142,15 +170,13 @@ def parse_json_ld_event(event_data: dict, source: str, source_url: str) -> Optio
 
         if start:
             if "T" in start:
-                date = start.split("T")[0]
-                time_part = start.split("T")[1]
+                date, _, time_part = start.partition("T")
                 start_time = time_part[:5]  # HH:MM
             else:
                 date = start[:10]
 
         if end and "T" in end:
-            time_part = end.split("T")[1]
-            end_time = time_part[:5]
+            end_time = end.partition("T")[2][:5]
 
         # Extract location
         location_data = event_data.get("location", {})
@@ -210,10 +236,32 @@ def parse_json_ld_event(event_data: dict, source: str, source_url: str) -> Optio
         return None
 
 
-@dataclass
+def _decompress(body: bytes, encoding: Optional[str]) -> bytes:
+    """Undo gzip/deflate Content-Encoding on a response body."""
+    encoding = (encoding or "").strip().lower()
+    if encoding in ("gzip", "x-gzip"):
+        return gzip.decompress(body)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            # Some servers send raw deflate without the zlib header
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    return body
+
+
+def _proxy_auth_headers(proxy: SplitResult) -> dict[str, str]:
+    """Proxy-Authorization header for a proxy URL with credentials, if any."""
+    if proxy.username is None:
+        return {}
+    credentials = f"{unquote(proxy.username)}:{unquote(proxy.password or '')}"
+    return {"Proxy-Authorization": "Basic " + base64.b64encode(credentials.encode()).decode("ascii")}
+
+
+@dataclass(slots=True)
 class FetchResult:
     """Result of an HTTP fetch."""
-    html: str
+    body: bytes
     status_code: int
     etag: Optional[str] = None
     last_modified: Optional[str] = None
@@ -228,16 +276,111 @@ class BaseScraper(ABC):
     source_url: str = ""
     default_location: str = ""
     default_address: str = ""
+    default_tags: tuple[str, ...] = ()
 
     def __init__(self):
         self.cache = get_cache()
-        self.default_tags: list[str] = []
+        # Keep-alive connections keyed by (scheme, host), one set per thread
+        self._connections = threading.local()
+        # Every connection opened from any thread, so close() can reach them
+        self._open_connections: list[HTTPConnection] = []
+        self._open_connections_lock = threading.Lock()
+        # HTTP(S)_PROXY settings, as urlopen would use them
+        self._proxies = getproxies()
+
+    def _proxy_for(self, scheme: str, host: str) -> Optional[SplitResult]:
+        """Return the proxy for a request, honouring NO_PROXY like urlopen."""
+        proxy = self._proxies.get(scheme)
+        if not proxy or proxy_bypass(host):
+            return None
+        if "://" not in proxy:
+            proxy = f"http://{proxy}"
+        return urlsplit(proxy)
+
+    def _get_connection(
+        self,
+        scheme: str,
+        netloc: str,
+        proxy: Optional[SplitResult] = None,
+    ) -> HTTPConnection:
+        """Return this thread's reusable connection to a host (or its proxy)."""
+        pool = getattr(self._connections, "pool", None)
+        if pool is None:
+            pool = self._connections.pool = {}
+        conn = pool.get((scheme, netloc))
+        if conn is None:
+            if proxy is None:
+                conn_class = HTTPSConnection if scheme == "https" else HTTPConnection
+                conn = conn_class(netloc, timeout=30)
+            elif scheme == "https":
+                # Tunnel through the proxy with CONNECT; TLS is end-to-end
+                conn = HTTPSConnection(proxy.hostname, proxy.port, timeout=30)
+                conn.set_tunnel(netloc, headers=_proxy_auth_headers(proxy))
+            else:
+                conn = HTTPConnection(proxy.hostname, proxy.port, timeout=30)
+            pool[(scheme, netloc)] = conn
+            with self._open_connections_lock:
+                self._open_connections.append(conn)
+        return conn
+
+    def close(self):
+        """Close every pooled connection, including other threads' ones."""
+        with self._open_connections_lock:
+            connections, self._open_connections = self._open_connections, []
+        for conn in connections:
+            conn.close()
+        # Drop this thread's pool; other threads' pools go with their threads
+        self._connections = threading.local()
+
+    def _send(self, url: str, headers: dict[str, str]) -> tuple[HTTPConnection, HTTPResponse]:
+        """Send a GET over a pooled connection."""
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            raise RuntimeError(f"Unsupported URL: {url}")
+        path = urlunsplit(("", "", parts.path or "/", parts.query, ""))
+
+        proxy = self._proxy_for(parts.scheme, parts.hostname or "")
+        if proxy and parts.scheme == "http":
+            # Plain HTTP proxies take the absolute URL as the request target
+            path = urlunsplit((parts.scheme, parts.netloc, parts.path or "/", parts.query, ""))
+            headers = {**headers, **_proxy_auth_headers(proxy)}
+
+        conn = self._get_connection(parts.scheme, parts.netloc, proxy)
+        reused = conn.sock is not None
+        try:
+            conn.request("GET", path, headers=headers)
+            return conn, conn.getresponse()
+        except (HTTPException, OSError):
+            # Reset the connection so a failed request doesn't poison it
+            conn.close()
+            if not reused:
+                raise
+
+        # The server may have closed the idle connection; retry on a fresh one
+        try:
+            conn.request("GET", path, headers=headers)
+            return conn, conn.getresponse()
+        except (HTTPException, OSError):
+            conn.close()
+            raise
 
-    def fetch(self, url: str, use_cache_headers: bool = True) -> FetchResult:
-        """Fetch a URL with optional HTTP caching."""
+    def fetch(
+        self,
+        url: str,
+        use_cache_headers: bool = True,
+        read_body: bool = True,
+    ) -> FetchResult:
+        """Fetch a URL with optional HTTP caching.
+
+        Connections are kept alive and reused for later fetches to the same
+        host from the same thread. With read_body=False only the status and
+        validators are returned, which is enough to tell whether a page
+        changed.
+        """
         headers = {
             "User-Agent": "RVA-Figure-Drawing-Calendar/1.0",
             "Accept": "text/html,application/xhtml+xml",
+            "Accept-Encoding": "gzip, deflate",
         }
 
         # Add cache headers for conditional request
@@ -245,27 +388,45 @@ class BaseScraper(ABC):
             cache_headers = self.cache.get_http_headers(self.source_id)
             headers.update(cache_headers)
 
-        request = Request(url, headers=headers)
-
+        conn = None
         try:
-            response = urlopen(request, timeout=30)
-            html = response.read().decode("utf-8")
+            for _ in range(MAX_REDIRECTS + 1):
+                conn, response = self._send(url, headers)
+                location = response.getheader("Location")
+                if response.status not in _REDIRECT_CODES or not location:
+                    break
+                response.read()  # Drain so the connection can be reused
+                url = urljoin(url, location)
+            else:
+                raise RuntimeError(f"Too many redirects fetching {url}")
 
-            return FetchResult(
-                html=html,
-                status_code=response.status,
-                etag=response.headers.get("ETag"),
-                last_modified=response.headers.get("Last-Modified"),
-            )
-        except HTTPError as e:
-            if e.code == 304:  # Not Modified
+            if response.status == 304:  # Not Modified
+                response.read()
                 return FetchResult(
-                    html="",
+                    body=b"",
                     status_code=304,
                     not_modified=True,
                 )
-            raise
-        except URLError as e:
+            if response.status >= 400:
+                response.read()
+                raise RuntimeError(f"Failed to fetch {url}: HTTP {response.status}")
+
+            if read_body:
+                body = _decompress(response.read(), response.getheader("Content-Encoding"))
+            else:
+                # Skip the download; the connection reopens on next use
+                body = b""
+                conn.close()
+
+            return FetchResult(
+                body=body,
+                status_code=response.status,
+                etag=response.getheader("ETag"),
+                last_modified=response.getheader("Last-Modified"),
+            )
+        except (HTTPException, OSError) as e:
+            if conn is not None:
+                conn.close()
             raise RuntimeError(f"Failed to fetch {url}: {e}")
 
     def get_cached_events(self) -> Optional[list[dict]]:
@@ -291,15 +452,16 @@ class BaseScraper(ABC):
             last_modified=last_modified,
         )
 
-    def extract_json_ld_events(self, html: str) -> list[Event]:
-        """Try to extract events from JSON-LD in the HTML."""
-        json_ld = extract_json_ld(html)
+    def extract_json_ld_events(self, body: bytes) -> list[Event]:
+        """Try to extract events from JSON-LD in the raw HTML."""
+        json_ld = extract_json_ld(body)
         event_data = find_events_in_json_ld(json_ld)
 
+        today = today_str()
         events = []
         for data in event_data:
             event = parse_json_ld_event(data, self.source_id, self.source_url)
-            if event and event.is_future():
+            if event and event.is_future(today):
                 events.append(event)
 
         return events
@@ -309,28 +471,92 @@ class BaseScraper(ABC):
         """Scrape events from this source. Override in subclasses."""
         pass
 
-    def run(self) -> list[dict]:
-        """Run the scraper with caching."""
-        # Check cache first
+    def revalidate(self) -> tuple[Optional[list[dict]], Optional[FetchResult]]:
+        """
+        Conditionally re-request the source page for an expired cache entry.
+
+        Returns the cached events if the server answers 304 Not Modified
+        (resetting the entry's TTL), plus the fetch result so fresh
+        validators can be stored after a full scrape.
+        """
+        try:
+            result = self.fetch(self.source_url, read_body=False)
+        except Exception as e:
+            print(f"  [{self.source_id}] Revalidation failed: {e}")
+            return None, None
+
+        entry = self.cache.cache.get(self.source_id)
+        if not (result.not_modified and entry):
+            return None, result
+
+        # The page is unchanged, but events cached last time may have passed
+        today = today_str()
+        future_events = [e for e in entry.events if e["date"] >= today]
+        if not future_events:
+            # Nothing left worth renewing; scrape again instead
+            return None, result
+
+        self.cache.touch(self.source_id, future_events)
+        print(f"  [{self.source_id}] Not modified, reusing cached data")
+        return future_events, result
+
+    def check_cache(self) -> tuple[Optional[list[dict]], Optional[FetchResult]]:
+        """
+        Return usable cached events, or None plus any revalidation result.
+
+        Fresh entries are returned as-is; expired ones are revalidated with
+        a conditional request first.
+        """
         cached = self.get_cached_events()
         if cached is not None:
-            return cached
+            return cached, None
 
-        print(f"  [{self.source_id}] Scraping fresh data...")
-        try:
-            events = self.scrape()
-            future_events = [e for e in events if e.is_future()]
+        # Expired, but the page may not have changed
+        return self.revalidate()
 
-            # Save to cache
+    def store_results(
+        self,
+        events: list[Event],
+        validation: Optional[FetchResult] = None,
+    ) -> list[dict]:
+        """Keep future events, cache them and return them as dicts."""
+        today = today_str()
+        future_events = [e for e in events if e.is_future(today)]
+
+        # Save to cache, along with validators for the next revalidation.
+        # Empty results get no validators, so they are re-scraped once they
+        # expire instead of being kept alive by 304s.
+        if validation and future_events:
+            self.save_to_cache(future_events, validation.etag, validation.last_modified)
+        else:
             self.save_to_cache(future_events)
 
-            print(f"  [{self.source_id}] Found {len(future_events)} future events")
-            return [e.to_dict() for e in future_events]
+        print(f"  [{self.source_id}] Found {len(future_events)} future events")
+        return [e.to_dict() for e in future_events]
+
+    def stale_fallback(self) -> list[dict]:
+        """Return stale cached events (or nothing) after a failed scrape."""
+        entry = self.cache.cache.get(self.source_id)
+        if entry:
+            print(f"  [{self.source_id}] Returning stale cache due to error")
+            return entry.events
+        return []
+
+    def refresh(self, validation: Optional[FetchResult] = None) -> list[dict]:
+        """Scrape fresh data and cache it, falling back to stale cache on error."""
+        print(f"  [{self.source_id}] Scraping fresh data...")
+        try:
+            return self.store_results(self.scrape(), validation)
         except Exception as e:
             print(f"  [{self.source_id}] Error: {e}")
-            # Try to return stale cache if available
-            entry = self.cache.cache.get(self.source_id)
-            if entry:
-                print(f"  [{self.source_id}] Returning stale cache due to error")
-                return entry.events
-            return []
+            return self.stale_fallback()
+
+    def run(self) -> list[dict]:
+        """Run the scraper with caching."""
+        try:
+            cached, validation = self.check_cache()
+            if cached is not None:
+                return cached
+            return self.refresh(validation)
+        finally:
+            self.close()
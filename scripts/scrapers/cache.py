@@ -2,12 +2,17 @@
 Caching layer for scrapers with source-specific TTLs and HTTP caching.
 """
 
+import atexit
+import functools
 import json
 import os
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
-from dataclasses import dataclass, asdict
+from typing import Any, Callable, Optional
+from dataclasses import dataclass, asdict, replace
+
+from .jsonio import dumps, loads
 
 # Cache file location
 CACHE_DIR = Path(__file__).parent.parent.parent / ".cache"
@@ -23,8 +28,7 @@ def _load_source_ttls() -> dict[str, int]:
     """Load TTLs from sources.json."""
     ttls = {"default": DEFAULT_TTL_HOURS}
     try:
-        with open(SOURCES_FILE, "r", encoding="utf-8") as f:
-            sources = json.load(f)
+        sources = loads(SOURCES_FILE.read_bytes())
         for source in sources:
             ttls[source["id"]] = source.get("cacheTtlHours", DEFAULT_TTL_HOURS)
     except (FileNotFoundError, json.JSONDecodeError):
@@ -40,23 +44,23 @@ class CacheEntry:
     """A cached scrape result."""
     source: str
     events: list
-    scraped_at: str  # ISO timestamp
+    scraped_at: float  # POSIX timestamp
     etag: Optional[str] = None
     last_modified: Optional[str] = None
     url: Optional[str] = None
 
+    def __post_init__(self):
+        # Not a dataclass field, so it is never written to the cache file
+        ttl_hours = SOURCE_TTLS.get(self.source, SOURCE_TTLS["default"])
+        self.expiry_ts = self.scraped_at + ttl_hours * 3600
+
     def is_expired(self) -> bool:
         """Check if this cache entry has expired based on source TTL."""
-        ttl_hours = SOURCE_TTLS.get(self.source, SOURCE_TTLS["default"])
-        scraped_time = datetime.fromisoformat(self.scraped_at)
-        expiry = scraped_time + timedelta(hours=ttl_hours)
-        return datetime.now() > expiry
+        return time.time() > self.expiry_ts
 
     def age_minutes(self) -> int:
         """Return the age of this cache entry in minutes."""
-        scraped_time = datetime.fromisoformat(self.scraped_at)
-        delta = datetime.now() - scraped_time
-        return int(delta.total_seconds() / 60)
+        return int((time.time() - self.scraped_at) / 60)
 
 
 class ScraperCache:
@@ -64,26 +68,39 @@ class ScraperCache:
 
     def __init__(self):
         self.cache: dict[str, CacheEntry] = {}
+        self._dirty = False
+        # Called with the invalidated source id, or None for invalidate_all()
+        self._invalidate_hooks: list[Callable[[Optional[str]], None]] = []
         self._load()
+        atexit.register(self.flush)
 
     def _load(self):
         """Load cache from disk."""
         if CACHE_FILE.exists():
             try:
-                with open(CACHE_FILE, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    for source, entry_data in data.items():
-                        self.cache[source] = CacheEntry(**entry_data)
-            except (json.JSONDecodeError, TypeError) as e:
+                data = loads(CACHE_FILE.read_bytes())
+                for source, entry_data in data.items():
+                    # Older caches stored scraped_at as an ISO string
+                    if isinstance(entry_data.get("scraped_at"), str):
+                        entry_data["scraped_at"] = datetime.fromisoformat(entry_data["scraped_at"]).timestamp()
+                    self.cache[source] = CacheEntry(**entry_data)
+            except (json.JSONDecodeError, TypeError, ValueError) as e:
                 print(f"Warning: Could not load cache: {e}")
                 self.cache = {}
 
     def _save(self):
-        """Save cache to disk."""
+        """Save cache to disk atomically."""
         CACHE_DIR.mkdir(parents=True, exist_ok=True)
-        with open(CACHE_FILE, "w", encoding="utf-8") as f:
-            data = {source: asdict(entry) for source, entry in self.cache.items()}
-            json.dump(data, f, indent=2)
+        data = {source: asdict(entry) for source, entry in self.cache.items()}
+        tmp = CACHE_FILE.with_suffix(".tmp")
+        tmp.write_bytes(dumps(data))
+        tmp.replace(CACHE_FILE)
+        self._dirty = False
+
+    def flush(self):
+        """Write pending changes to disk, if any."""
+        if self._dirty:
+            self._save()
 
     def get(self, source: str) -> Optional[CacheEntry]:
         """Get cached entry for a source if valid."""
@@ -115,23 +132,47 @@ class ScraperCache:
         self.cache[source] = CacheEntry(
             source=source,
             events=events,
-            scraped_at=datetime.now().isoformat(),
+            scraped_at=time.time(),
             url=url,
             etag=etag,
             last_modified=last_modified,
         )
-        self._save()
+        self._dirty = True
+
+    def touch(self, source: str, events: Optional[list] = None):
+        """Reset a cached entry's age, keeping its validators.
+
+        Pass events to replace the cached events (e.g. with past events
+        dropped); otherwise they are kept as-is.
+        """
+        entry = self.cache.get(source)
+        if entry:
+            # replace() re-runs __post_init__, so expiry_ts follows
+            changes = {"scraped_at": time.time()}
+            if events is not None:
+                changes["events"] = events
+            self.cache[source] = replace(entry, **changes)
+            self._dirty = True
+
+    def on_invalidate(self, hook: Callable[[Optional[str]], None]):
+        """Register a hook to clear related in-process state on invalidation."""
+        if hook not in self._invalidate_hooks:
+            self._invalidate_hooks.append(hook)
 
     def invalidate(self, source: str):
         """Invalidate cache for a source."""
         if source in self.cache:
             del self.cache[source]
-            self._save()
+            self._dirty = True
+        for hook in self._invalidate_hooks:
+            hook(source)
 
     def invalidate_all(self):
         """Clear all cached data."""
         self.cache = {}
-        self._save()
+        self._dirty = True
+        for hook in self._invalidate_hooks:
+            hook(None)
 
     def get_stats(self) -> dict[str, Any]:
         """Get cache statistics."""
@@ -149,13 +190,7 @@ class ScraperCache:
         return stats
 
 
-# Singleton instance
-_cache_instance: Optional[ScraperCache] = None
-
-
+@functools.cache
 def get_cache() -> ScraperCache:
     """Get the singleton cache instance."""
-    global _cache_instance
-    if _cache_instance is None:
-        _cache_instance = ScraperCache()
-    return _cache_instance
+    return ScraperCache()
@@ -8,21 +8,20 @@ but only when the cache is stale.
 import json
 import subprocess
 import sys
+import threading
 from pathlib import Path
 from typing import Optional
 
-from .base import BaseScraper, Event
+from .base import BaseScraper, Event, FetchResult
 from .cache import get_cache
+from .jsonio import loads
+from .eventbrite import EventbriteScraper
 
 SOURCES_FILE = Path(__file__).parent.parent / "sources.json"
 
-SCRAPE_PROMPT = '''You are scraping figure drawing events. Use Playwright to visit the URL and extract events.
-
-Visit: {url}
-
-Output a JSON array of events (no markdown, just raw JSON):
-[
-  {{
+# Shared by the single-source and batch prompts (literal braces; not a
+# format template)
+EVENT_SCHEMA = '''{
     "title": "Event title",
     "date": "YYYY-MM-DD",
     "startTime": "HH:MM",
@@ -35,7 +34,15 @@ Output a JSON array of events (no markdown, just raw JSON):
     "description": "Brief description",
     "tags": ["open-session", "nude"],
     "registrationStatus": "available|waitlist|closed|sold-out|unknown"
-  }}
+  }'''
+
+SCRAPE_PROMPT = '''You are scraping figure drawing events. Use Playwright to visit the URL and extract events.
+
+Visit: {url}
+
+Output a JSON array of events (no markdown, just raw JSON):
+[
+  {event_schema}
 ]
 
 Rules:
@@ -47,6 +54,59 @@ Rules:
 {extra_instructions}
 '''
 
+BATCH_SCRAPE_PROMPT = '''You are scraping figure drawing events from several sources. Use Playwright to visit each source URL and extract its events.
+
+{sources}
+
+Output a single JSON object mapping each source id to its array of events (no markdown, just raw JSON):
+{{
+  "source-id": [
+  {event_schema}
+  ]
+}}
+
+Rules:
+- Include every source id listed above, with an empty array if it has no events
+- Only include figure drawing / life drawing events
+- Only include future events (today or later)
+- Extract actual dates, not relative dates
+- Follow each source's notes when scraping that source
+- Output ONLY a valid JSON object, nothing else
+'''
+
+BATCH_SOURCE_TEMPLATE = '''Source id: {source_id}
+Visit: {url}
+Notes: {extra_instructions}
+'''
+
+# Claude CLI timeout, per source scraped in the invocation
+CLAUDE_TIMEOUT = 300
+
+
+# Claude CLI doesn't handle parallel runs well; allow one at a time
+_claude_lock = threading.Lock()
+
+
+def _run_claude(prompt: str, label: str, timeout: int = CLAUDE_TIMEOUT) -> Optional[bytes]:
+    """Run the Claude CLI on a prompt and return its raw output, or None on failure."""
+    try:
+        # Keep stdout as bytes; the JSON parser reads UTF-8 bytes directly
+        with _claude_lock:
+            result = subprocess.run(
+                ["claude", "-p", prompt, "--print", "--output-format", "text", "--model", "sonnet"],
+                capture_output=True,
+                timeout=timeout,
+            )
+    except subprocess.TimeoutExpired:
+        print(f"  [{label}] Claude timed out")
+        return None
+
+    if result.returncode != 0:
+        print(f"  [{label}] Claude error: {result.stderr.decode('utf-8', errors='replace')}")
+        return None
+
+    return result.stdout.strip()
+
 
 class ClaudePlaywrightScraper(BaseScraper):
     """
@@ -54,6 +114,8 @@ class ClaudePlaywrightScraper(BaseScraper):
     Checks cache first to avoid unnecessary Claude invocations.
     """
 
+    default_tags: tuple[str, ...] = ("open-session", "nude")
+
     def __init__(
         self,
         source_id: str,
@@ -69,98 +131,187 @@ class ClaudePlaywrightScraper(BaseScraper):
         self.default_location = default_location
         self.default_address = default_address
         self.extra_instructions = extra_instructions
-        self.default_tags = default_tags or ["open-session", "nude"]
+        if default_tags:
+            self.default_tags = tuple(default_tags)
+        # Inputs are fixed per instance, so format the prompt once
+        self._prompt = SCRAPE_PROMPT.format(
+            url=source_url,
+            extra_instructions=extra_instructions,
+            event_schema=EVENT_SCHEMA,
+        )
 
     def scrape(self) -> list[Event]:
-        """Invoke Claude to scrape the page."""
-        prompt = SCRAPE_PROMPT.format(
-            url=self.source_url,
-            extra_instructions=self.extra_instructions,
-        )
+        """Invoke Claude to scrape the page, unless the cache is still fresh."""
+        # run() checks the cache too, but scrape() may be called directly
+        cached = self.cache.get(self.source_id)
+        if cached:
+            print(f"  [{self.source_id}] Cache still fresh, skipping Claude")
+            return [Event.from_dict(d) for d in cached.events]
 
-        try:
-            # Run Claude CLI
-            result = subprocess.run(
-                ["claude", "-p", prompt, "--print", "--output-format", "text", "--model", "sonnet"],
-                capture_output=True,
-                text=True,
-                timeout=300,
-            )
+        # Failures raise rather than returning [], so run() falls back to
+        # stale cache instead of caching an empty result
+        output = _run_claude(self._prompt, self.source_id)
+        if output is None:
+            raise RuntimeError("Claude run failed")
 
-            if result.returncode != 0:
-                print(f"  [{self.source_id}] Claude error: {result.stderr}")
-                return []
-
-            # Parse JSON output
-            output = result.stdout.strip()
-
-            # Try to extract JSON from the output
-            events_data = self._extract_json(output)
-
-            if events_data is None:
-                print(f"  [{self.source_id}] No valid JSON in output")
-                return []
-
-            # Convert to Event objects
-            events = []
-            for data in events_data:
-                event = Event(
-                    source=self.source_id,
-                    source_url=self.source_url,
-                    title=data.get("title", ""),
-                    date=data.get("date", ""),
-                    start_time=data.get("startTime"),
-                    end_time=data.get("endTime"),
-                    location=data.get("location", self.default_location),
-                    address=data.get("address", self.default_address),
-                    cost=data.get("cost", ""),
-                    cost_value=data.get("costValue"),
-                    url=data.get("url", ""),
-                    description=data.get("description", ""),
-                    tags=data.get("tags", self.default_tags),
-                    registration_status=data.get("registrationStatus", "unknown"),
-                    instructor=data.get("instructor"),
-                )
-                events.append(event)
+        # Try to extract JSON from the output
+        events_data = self._extract_json(output)
 
-            return events
+        if events_data is None:
+            raise RuntimeError("No valid JSON in output")
 
-        except subprocess.TimeoutExpired:
-            print(f"  [{self.source_id}] Claude timed out")
-            return []
-        except Exception as e:
-            print(f"  [{self.source_id}] Error: {e}")
-            return []
+        return self.to_events(events_data)
+
+    def to_events(self, events_data: list[dict]) -> list[Event]:
+        """Convert Claude's event dicts to Event objects for this source."""
+        events = []
+        for data in events_data:
+            event = Event(
+                source=self.source_id,
+                source_url=self.source_url,
+                title=data.get("title", ""),
+                date=data.get("date", ""),
+                start_time=data.get("startTime"),
+                end_time=data.get("endTime"),
+                location=data.get("location", self.default_location),
+                address=data.get("address", self.default_address),
+                cost=data.get("cost", ""),
+                cost_value=data.get("costValue"),
+                url=data.get("url", ""),
+                description=data.get("description", ""),
+                tags=list(data.get("tags") or self.default_tags),
+                registration_status=data.get("registrationStatus", "unknown"),
+                instructor=data.get("instructor"),
+            )
+            events.append(event)
+
+        return events
+
+    def _extract_json(self, text: bytes) -> Optional[list]:
+        """Extract JSON array from raw text output (already stripped)."""
+        if text.startswith(b"[") and text.endswith(b"]"):
+            # Fast path: Claude usually returns just the JSON array
+            candidate = text
+        else:
+            # Take the span from the first [ to the last ] (linear, no backtracking)
+            start = text.find(b"[")
+            end = text.rfind(b"]")
+            if not 0 <= start < end:
+                return None
+            candidate = text[start:end + 1]
 
-    def _extract_json(self, text: str) -> Optional[list]:
-        """Extract JSON array from text output."""
-        # Try direct parse
         try:
-            return json.loads(text)
+            return loads(candidate)
         except json.JSONDecodeError:
-            pass
+            return None
+
+class ClaudeBatchScraper:
+    """
+    Scrapes several Claude-backed sources with a single Claude invocation.
+
+    Each source keeps its own caching: only sources whose cache is stale
+    (and whose page changed) are included in the batch, and results are
+    cached per source.
+    """
+
+    def __init__(self, scrapers: list[ClaudePlaywrightScraper]):
+        self.scrapers = scrapers
+
+    def run(self) -> dict[str, list[dict]]:
+        """Run the batch and return event dicts keyed by source id."""
+        try:
+            return self._run()
+        finally:
+            for scraper in self.scrapers:
+                scraper.close()
 
-        # Try to find JSON array in the text
-        import re
-        match = re.search(r'\[[\s\S]*\]', text)
-        if match:
+    def _run(self) -> dict[str, list[dict]]:
+        results: dict[str, list[dict]] = {}
+        pending: list[tuple[ClaudePlaywrightScraper, Optional[FetchResult]]] = []
+
+        for scraper in self.scrapers:
+            cached, validation = scraper.check_cache()
+            if cached is not None:
+                results[scraper.source_id] = cached
+            else:
+                pending.append((scraper, validation))
+
+        # A batch of one is just a normal scrape
+        if len(pending) == 1:
+            scraper, validation = pending[0]
+            results[scraper.source_id] = scraper.refresh(validation)
+            return results
+
+        if not pending:
+            return results
+
+        print(f"  [claude-batch] Scraping {[s.source_id for s, _ in pending]} in one Claude run...")
+        output = _run_claude(
+            self._build_prompt([s for s, _ in pending]),
+            "claude-batch",
+            timeout=CLAUDE_TIMEOUT * len(pending),
+        )
+        batch_data = _extract_json_object(output) if output is not None else None
+        if output is not None and batch_data is None:
+            print("  [claude-batch] No valid JSON in output")
+
+        for scraper, validation in pending:
+            events_data = batch_data.get(scraper.source_id) if batch_data else None
+            if not isinstance(events_data, list):
+                # Missing from the output; don't cache an empty result
+                results[scraper.source_id] = scraper.stale_fallback()
+                continue
             try:
-                return json.loads(match.group())
-            except json.JSONDecodeError:
-                pass
+                results[scraper.source_id] = scraper.store_results(
+                    scraper.to_events(events_data), validation
+                )
+            except Exception as e:
+                print(f"  [{scraper.source_id}] Error: {e}")
+                results[scraper.source_id] = scraper.stale_fallback()
 
-        return None
+        return results
+
+    @staticmethod
+    def _build_prompt(scrapers: list[ClaudePlaywrightScraper]) -> str:
+        """Build one prompt covering every source in the batch."""
+        sources = "\n".join(
+            BATCH_SOURCE_TEMPLATE.format(
+                source_id=s.source_id,
+                url=s.source_url,
+                extra_instructions=s.extra_instructions or "(none)",
+            )
+            for s in scrapers
+        )
+        return BATCH_SCRAPE_PROMPT.format(sources=sources, event_schema=EVENT_SCHEMA)
+
+
+def _extract_json_object(text: bytes) -> Optional[dict]:
+    """Extract a JSON object from raw text output."""
+    start = text.find(b"{")
+    end = text.rfind(b"}")
+    if 0 <= start < end:
+        try:
+            data = loads(text[start:end + 1])
+        except json.JSONDecodeError:
+            return None
+        if isinstance(data, dict):
+            return data
+    return None
 
 
 def load_sources() -> list[dict]:
     """Load source definitions from sources.json."""
-    with open(SOURCES_FILE, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return loads(SOURCES_FILE.read_bytes())
 
 
-def create_scraper(source: dict) -> ClaudePlaywrightScraper:
-    """Create a scraper from a source config dict."""
-    return ClaudePlaywrightScraper(
+def create_scraper(source: dict) -> BaseScraper:
+    """
+    Create a scraper from a source config dict.
+
+    Eventbrite uses its JSON-LD scraper, with Claude only as a fallback when
+    that finds nothing; every other source is scraped by Claude.
+    """
+    claude_scraper = ClaudePlaywrightScraper(
         source_id=source["id"],
         source_url=source["url"],
         default_location=source.get("location", ""),
@@ -168,3 +319,12 @@ def create_scraper(source: dict) -> ClaudePlaywrightScraper:
         extra_instructions=source.get("extraInstructions", ""),
         default_tags=source.get("defaultTags"),
     )
+    if source["id"] == EventbriteScraper.source_id:
+        return EventbriteScraper(
+            source_url=source["url"],
+            default_location=source.get("location", ""),
+            default_address=source.get("address", ""),
+            default_tags=source.get("defaultTags"),
+            fallback=claude_scraper,
+        )
+    return claude_scraper
@@ -9,37 +9,87 @@ Strategy:
 """
 
 import re
-from html.parser import HTMLParser
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from urllib.parse import urljoin
 
-from .base import BaseScraper, Event, extract_json_ld, find_events_in_json_ld, parse_json_ld_event
-
-
-class EventLinkExtractor(HTMLParser):
-    """Extract Eventbrite event links from search results."""
-
-    def __init__(self):
-        super().__init__()
-        self.event_urls: list[str] = []
-        self._event_pattern = re.compile(r"https://www\.eventbrite\.com/e/[^\"]+")
-
-    def handle_starttag(self, tag, attrs):
-        if tag == "a":
-            href = dict(attrs).get("href", "")
-            if "/e/" in href and "eventbrite.com" in href:
-                # Clean up the URL
-                url = href.split("?")[0]  # Remove query params
-                if url not in self.event_urls:
-                    self.event_urls.append(url)
-
-    def handle_data(self, data):
-        # Also look for URLs in data-href or similar
-        matches = self._event_pattern.findall(data)
-        for url in matches:
-            clean = url.split("?")[0]
-            if clean not in self.event_urls:
-                self.event_urls.append(clean)
+from .base import (
+    BaseScraper,
+    Event,
+    extract_json_ld,
+    find_events_in_json_ld,
+    find_first_json_ld_event,
+    parse_json_ld_event,
+    today_str,
+)
+
+
+# Absolute event URLs, whether in href attributes or page text/scripts.
+# Query strings and fragments are left out of the match.
+_EVENT_URL_RE = re.compile(rb'https?://(?:www\.)?eventbrite\.com/e/[^"\'\s<>?#]+')
+
+# Most event pages fetched per scrape
+MAX_EVENT_PAGES = 20
+
+# Figure drawing related titles ("life drawing" is covered by "drawing")
+_TITLE_RE = re.compile(r"figure|drawing", re.IGNORECASE)
+
+# Parsed event pages are memoized in-process for a short while, so a
+# repeat scrape soon after doesn't refetch them
+EVENT_PAGE_TTL_SECONDS = 15 * 60
+MAX_MEMOIZED_PAGES = 512
+
+# URL -> (parsed at, event dict or None for pages that aren't figure
+# drawing events), oldest first. Fetch errors aren't stored, so those
+# pages are retried.
+_event_pages: OrderedDict[str, tuple[float, Optional[dict]]] = OrderedDict()
+_event_pages_lock = threading.Lock()
+
+
+def extract_event_urls(body: bytes, limit: Optional[int] = None) -> list[str]:
+    """
+    Extract unique Eventbrite event links from search results, in page order.
+
+    Scanning stops as soon as limit unique URLs have been found.
+    """
+    seen: dict[str, None] = {}
+    for match in _EVENT_URL_RE.finditer(body):
+        seen.setdefault(match.group().decode("ascii", "replace"), None)
+        if limit is not None and len(seen) >= limit:
+            break
+    return list(seen)
+
+
+def _recall_event_page(url: str) -> tuple[bool, Optional[dict]]:
+    """Return (found, event dict) for a recently parsed event page."""
+    with _event_pages_lock:
+        memo = _event_pages.get(url)
+        if memo is None:
+            return False, None
+        parsed_at, data = memo
+        if time.time() - parsed_at > EVENT_PAGE_TTL_SECONDS:
+            del _event_pages[url]
+            return False, None
+        return True, data
+
+
+def _remember_event_page(url: str, data: Optional[dict]):
+    """Memoize a parsed event page, evicting the oldest past the size limit."""
+    with _event_pages_lock:
+        _event_pages[url] = (time.time(), data)
+        _event_pages.move_to_end(url)
+        while len(_event_pages) > MAX_MEMOIZED_PAGES:
+            _event_pages.popitem(last=False)
+
+
+def _forget_event_pages(source: Optional[str]):
+    """Cache invalidation hook: drop memoized pages along with the source."""
+    if source is None or source == EventbriteScraper.source_id:
+        with _event_pages_lock:
+            _event_pages.clear()
 
 
 class EventbriteScraper(BaseScraper):
@@ -47,62 +97,118 @@ class EventbriteScraper(BaseScraper):
 
     source_id = "eventbrite"
     source_url = "https://www.eventbrite.com/d/va--richmond/figure-drawing/"
-    default_tags = ["open-session", "nude"]
+    default_tags = ("open-session", "nude")
+
+    def __init__(
+        self,
+        source_url: str = "",
+        default_location: str = "",
+        default_address: str = "",
+        default_tags: list[str] | None = None,
+        fallback: Optional[BaseScraper] = None,
+    ):
+        super().__init__()
+        # Settings from sources.json override the class defaults
+        if source_url:
+            self.source_url = source_url
+        self.default_location = default_location
+        self.default_address = default_address
+        if default_tags:
+            self.default_tags = tuple(default_tags)
+        # Used only when JSON-LD turns up nothing (e.g. the Claude scraper)
+        self.fallback = fallback
+        # --force / --clear-cache also drop the memoized event pages
+        self.cache.on_invalidate(_forget_event_pages)
 
     def scrape(self) -> list[Event]:
         """Scrape Eventbrite for figure drawing events."""
-        events = []
-
-        # First, try to get event URLs from search results
         try:
-            result = self.fetch(self.source_url, use_cache_headers=False)
+            events = self._scrape_json_ld()
+        except Exception as e:
+            if not self.fallback:
+                raise
+            print(f"  [{self.source_id}] Error fetching search page: {e}")
+            events = []
 
-            # Try JSON-LD from search page first
-            json_ld_events = self.extract_json_ld_events(result.html)
-            if json_ld_events:
-                print(f"  [{self.source_id}] Found {len(json_ld_events)} events via JSON-LD")
-                return json_ld_events
+        if not events and self.fallback:
+            print(f"  [{self.source_id}] No events via JSON-LD, trying fallback scraper")
+            return self.fallback.scrape()
+        return events
 
-            # Extract event URLs from search results
-            parser = EventLinkExtractor()
-            parser.feed(result.html)
+    def _scrape_json_ld(self) -> list[Event]:
+        """
+        Scrape events from JSON-LD on the search and event pages.
 
-            # Limit to avoid too many requests
-            event_urls = parser.event_urls[:20]
-            print(f"  [{self.source_id}] Found {len(event_urls)} event URLs to check")
+        Raises if the search page can't be fetched, so the failure isn't
+        mistaken for "no events".
+        """
+        events = []
 
-            # Fetch each event page for JSON-LD
-            for url in event_urls:
-                event = self._fetch_event_page(url)
+        # First, try to get event URLs from search results
+        result = self.fetch(self.source_url, use_cache_headers=False)
+
+        # Try JSON-LD from search page first; it can list unrelated events
+        today = today_str()
+        json_ld_events = [
+            event
+            for event in map(self._build_event, find_events_in_json_ld(extract_json_ld(result.body)))
+            if event and event.is_future(today)
+        ]
+        if json_ld_events:
+            print(f"  [{self.source_id}] Found {len(json_ld_events)} events via JSON-LD")
+            return json_ld_events
+
+        # Extract event URLs from search results
+        # Limit to avoid too many requests
+        event_urls = extract_event_urls(result.body, limit=MAX_EVENT_PAGES)
+        print(f"  [{self.source_id}] Found {len(event_urls)} event URLs to check")
+
+        # Fetch event pages concurrently for JSON-LD; map() keeps the
+        # search result order. Workers are capped to stay polite.
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for event in executor.map(self._fetch_event_page, event_urls):
                 if event:
                     events.append(event)
 
-        except Exception as e:
-            print(f"  [{self.source_id}] Error fetching search page: {e}")
-
         return events
 
     def _fetch_event_page(self, url: str) -> Optional[Event]:
         """Fetch an individual event page and extract JSON-LD."""
+        # Pages parsed recently in this process aren't fetched again
+        found, data = _recall_event_page(url)
+        if found:
+            return Event.from_dict(data) if data else None
+
+        event = None
         try:
             result = self.fetch(url, use_cache_headers=False)
 
-            json_ld = extract_json_ld(result.html)
-            event_data = find_events_in_json_ld(json_ld)
-
+            # Pages carry several JSON-LD blocks; stop at the first Event
+            event_data = find_first_json_ld_event(result.body)
             if event_data:
-                event = parse_json_ld_event(event_data[0], self.source_id, self.source_url)
-                if event:
-                    event.url = url
-                    # Check if it's figure drawing related
-                    title_lower = event.title.lower()
-                    if "figure" in title_lower or "life drawing" in title_lower or "drawing" in title_lower:
-                        event.tags = self.default_tags
-                        return event
+                event = self._build_event(event_data, url)
         except Exception as e:
+            # Not memoized, so the page is retried next time
             print(f"    Error fetching {url}: {e}")
-
-        return None
+            return None
+
+        _remember_event_page(url, event.to_dict() if event else None)
+        return event
+
+    def _build_event(self, event_data: dict, url: Optional[str] = None) -> Optional[Event]:
+        """Build an Event from JSON-LD, or None if it isn't figure drawing related."""
+        # Check the title before doing the work of building the Event
+        if not _TITLE_RE.search(event_data.get("name") or ""):
+            return None
+
+        event = parse_json_ld_event(event_data, self.source_id, self.source_url)
+        if event:
+            if url:
+                event.url = url
+            event.location = event.location or self.default_location
+            event.address = event.address or self.default_address
+            event.tags = list(self.default_tags)
+        return event
 
 
 def create_scraper() -> EventbriteScraper:
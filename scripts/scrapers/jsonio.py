@@ -0,0 +1,29 @@
+"""
+JSON helpers shared by the scrapers, using orjson when it is installed.
+
+Both work on UTF-8 bytes. orjson.JSONDecodeError subclasses
+json.JSONDecodeError, so callers can catch the stdlib exception regardless
+of which backend is in use.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize obj to indented JSON bytes."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def loads(data: bytes) -> Any:
+        """Parse JSON from bytes (or str)."""
+        return orjson.loads(data)
+except ImportError:  # orjson is optional; fall back to stdlib json
+    def dumps(obj: Any) -> bytes:
+        """Serialize obj to indented JSON bytes."""
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+    def loads(data: bytes) -> Any:
+        """Parse JSON from bytes (or str)."""
+        return json.loads(data)